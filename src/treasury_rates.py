@@ -6,7 +6,8 @@ Fetches daily treasury yield curve data from the US Treasury website,
 performs linear interpolation for missing maturities, and converts
 Bond Equivalent Yields (BEY) to continuously compounded APY rates.
 
-This implementation uses only Python standard library modules.
+This implementation uses only Python standard library modules. If lxml is
+installed it is used as a faster drop-in for xml.etree.ElementTree.
 
 VIX Methodology Support:
 The processor implements the interest rate calculation methodology from the
@@ -19,21 +20,66 @@ Cboe VIX Mathematics Methodology document, including:
 
 import argparse
 import asyncio
+import bisect
+import gzip
+import io
 import json
 import logging
 import math
 import sys
 import urllib.request
 import urllib.error
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:  # pragma: no cover - depends on environment
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+    HAS_NUMPY = False
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:  # pragma: no cover - depends on environment
+    aiohttp = None
+    HAS_AIOHTTP = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on environment
+    njit = None
+    prange = range
+    HAS_NUMBA = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# XML namespaces used by the Treasury Atom/OData feed
+_NS: Dict[str, str] = {
+    'a': 'http://www.w3.org/2005/Atom',
+    'm': 'http://schemas.microsoft.com/ado/2007/08/dataservices/metadata',
+    'd': 'http://schemas.microsoft.com/ado/2007/08/dataservices',
+}
+
 
 @dataclass(frozen=True)
 class YieldCurveConfig:
@@ -42,11 +88,16 @@ class YieldCurveConfig:
     year: int = datetime.now().year  # Dynamic year
     maturities: Tuple[int, ...] = (30, 60, 91, 182, 365, 730, 1095, 1825, 2555, 3650, 7300, 10950)
     timeout: int = 30
+    _url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Format the URL once; the config is frozen so it can never go stale
+        object.__setattr__(self, '_url', self.url_template.format(year=self.year))
 
     @property
     def url(self) -> str:
-        """Generate URL with the specified year."""
-        return self.url_template.format(year=self.year)
+        """URL for the specified year."""
+        return self._url
 
 
 class MaturityMapper:
@@ -74,11 +125,22 @@ class MaturityMapper:
         return cls.FIELD_TO_DAYS.get(field)
 
 
+# Fully qualified tag names, so the document never has to be rewritten.
+# Interned so comparisons against parser-produced tags can short-circuit on identity.
+_ENTRY_TAG = sys.intern(f"{{{_NS['a']}}}entry")
+_DATE_TAG = sys.intern(f"{{{_NS['d']}}}NEW_DATE")
+_BC_TAG_TO_DAYS: Dict[str, int] = {
+    sys.intern(f"{{{_NS['d']}}}{field}"): days
+    for field, days in MaturityMapper.FIELD_TO_DAYS.items()
+}
+
+
 class RateInterpolator:
     """Performs linear interpolation for missing maturities."""
 
     def __init__(self, target_maturities: Tuple[int, ...]):
         self.target_maturities = target_maturities
+        self._targets = np.asarray(target_maturities, dtype=np.int64) if HAS_NUMPY else None
 
     def interpolate(self, raw_rates: Dict[int, float]) -> Optional[Dict[int, float]]:
         """
@@ -93,6 +155,9 @@ class RateInterpolator:
         if not raw_rates:
             return None
 
+        if HAS_NUMPY:
+            return self._interpolate_numpy(raw_rates)
+
         sorted_maturities = sorted(raw_rates.keys())
         interpolated = {}
 
@@ -100,8 +165,10 @@ class RateInterpolator:
             if target in raw_rates:
                 interpolated[target] = raw_rates[target]
             else:
-                lower = self._find_bound(sorted_maturities, target, upper=False)
-                upper = self._find_bound(sorted_maturities, target, upper=True)
+                # target is not a key, so sorted_maturities[i] > target
+                i = bisect.bisect_left(sorted_maturities, target)
+                lower = sorted_maturities[i - 1] if i > 0 else None
+                upper = sorted_maturities[i] if i < len(sorted_maturities) else None
 
                 if lower is None or upper is None:
                     logger.warning(f"Cannot interpolate for {target} days")
@@ -115,18 +182,21 @@ class RateInterpolator:
 
         return interpolated
 
-    @staticmethod
-    def _find_bound(sorted_list: List[int], target: int, upper: bool) -> Optional[int]:
-        """Find lower or upper bound for interpolation."""
-        if upper:
-            for val in sorted_list:
-                if val > target:
-                    return val
-        else:
-            for val in reversed(sorted_list):
-                if val < target:
-                    return val
-        return None
+    def _interpolate_numpy(self, raw_rates: Dict[int, float]) -> Dict[int, float]:
+        """Interpolate all target maturities with a single numpy.interp call."""
+        xp, fp = _curve_arrays(raw_rates)
+        ys = np.interp(self._targets, xp, fp)
+
+        # np.interp clamps outside the known range; skip those targets instead
+        in_range = (self._targets >= xp[0]) & (self._targets <= xp[-1])
+        for target in self._targets[~in_range].tolist():
+            logger.warning(f"Cannot interpolate for {target} days")
+
+        return {
+            target: rate
+            for target, rate, valid in zip(self._targets.tolist(), ys.tolist(), in_range.tolist())
+            if valid
+        }
 
     @staticmethod
     def _linear_interpolate(x1: int, x2: int, x: int, y1: float, y2: float) -> float:
@@ -137,8 +207,8 @@ class RateInterpolator:
 class RateConverter:
     """Converts Bond Equivalent Yields to continuous APY rates."""
 
-    @staticmethod
-    def to_continuous(rates: Dict[int, float]) -> Dict[int, float]:
+    @classmethod
+    def to_continuous(cls, rates: Dict[int, float]) -> Dict[int, float]:
         """
         Convert BEY to continuous APY rate using Cboe methodology.
 
@@ -148,119 +218,347 @@ class RateConverter:
         Returns:
             Dictionary mapping days to continuous rates
         """
-        continuous_rates = {}
+        return dict(zip(rates.keys(), cls._convert(list(rates.values()))))
+
+    @classmethod
+    def to_continuous_batch(cls, curves: Dict[str, Dict[int, float]]) -> Dict[str, Dict[int, float]]:
+        """
+        Convert BEY curves for many dates in a single pass.
 
-        for days, bey in rates.items():
-            # APY = (1 + BEY/2)^2 - 1
-            apy = (1.0 + bey / 200.0) ** 2 - 1.0
-            # r_t = ln(1 + APY)
-            continuous_rates[days] = math.log(1.0 + apy)
+        Args:
+            curves: Dictionary mapping dates to BEY rate dictionaries
 
-        return continuous_rates
+        Returns:
+            Dictionary mapping dates to continuous rate dictionaries
+        """
+        # Pack every rate into one flat sequence, convert, then slice per date
+        flat = [bey for rates in curves.values() for bey in rates.values()]
+        converted = cls._convert(flat)
+
+        continuous_curves = {}
+        start = 0
+        for date, rates in curves.items():
+            stop = start + len(rates)
+            continuous_curves[date] = dict(zip(rates.keys(), converted[start:stop]))
+            start = stop
+
+        return continuous_curves
+
+    @staticmethod
+    def _convert(bey_rates: List[float]) -> List[float]:
+        """Convert a flat sequence of BEY rates (in percent) to continuous rates."""
+        # APY = (1 + BEY/2)^2 - 1 and r_t = ln(1 + APY) reduce to
+        # r_t = 2 * log1p(BEY/2), which avoids cancellation near zero
+        if HAS_NUMPY:
+            bey = np.asarray(bey_rates, dtype=np.float64)
+            return (2.0 * np.log1p(bey / 200.0)).tolist()
+
+        return [2.0 * math.log1p(bey / 200.0) for bey in bey_rates]
+
+
+def _curve_arrays(raw_rates: Dict[int, float]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Pack a rate dictionary into sorted (days, rates) NumPy arrays."""
+    xp = np.fromiter(sorted(raw_rates), dtype=np.int64, count=len(raw_rates))
+    fp = np.array([raw_rates[days] for days in xp.tolist()], dtype=np.float64)
+    return xp, fp
+
+
+def _compute_curve(xp, fp, targets):
+    """
+    Interpolate BEY rates and convert them to continuous rates in one pass.
+
+    Args:
+        xp: Sorted observed maturities in days (int64)
+        fp: BEY rates in percent for each observed maturity (float64)
+        targets: Target maturities in days (int64)
+
+    Returns:
+        Continuous rates for each target, NaN where the target is out of range
+    """
+    n = xp.shape[0]
+    out = np.empty(targets.shape[0], dtype=np.float64)
+
+    for i in range(targets.shape[0]):
+        target = targets[i]
+        if target < xp[0] or target > xp[n - 1]:
+            out[i] = np.nan
+            continue
+
+        hi = np.searchsorted(xp, target)
+        if xp[hi] == target:
+            bey = fp[hi]
+        else:
+            lo = hi - 1
+            bey = fp[lo] + (fp[hi] - fp[lo]) * (target - xp[lo]) / (xp[hi] - xp[lo])
+
+        # r_t = ln((1 + BEY/2)^2) = 2 * log1p(BEY/2)
+        out[i] = 2.0 * math.log1p(bey / 200.0)
+
+    return out
+
+
+def _compute_curves(rate_matrix, raw_days, targets):
+    """
+    Run _compute_curve for every row of a (dates x raw maturities) matrix.
+
+    Args:
+        rate_matrix: BEY rates per date and raw maturity, NaN where missing
+        raw_days: Sorted raw maturities in days, one per matrix column (int64)
+        targets: Target maturities in days (int64)
+
+    Returns:
+        (dates x targets) matrix of continuous rates, NaN where unavailable
+    """
+    n_dates = rate_matrix.shape[0]
+    out = np.full((n_dates, targets.shape[0]), np.nan)
+
+    for i in prange(n_dates):
+        # Compact the observed maturities for this date
+        valid = ~np.isnan(rate_matrix[i])
+        if valid.any():
+            out[i] = _compute_curve(raw_days[valid], rate_matrix[i][valid], targets)
+
+    return out
+
+
+if HAS_NUMBA:
+    # NaN marks missing/out-of-range points, so keep IEEE NaN semantics under fastmath
+    _FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+    # Explicit signatures compile eagerly at import and give stable on-disk
+    # cache keys, so later runs load the machine code instead of re-JITting
+    _compute_curve = njit(
+        'float64[:](int64[:], float64[:], int64[:])',
+        cache=True, fastmath=_FASTMATH,
+    )(_compute_curve)
+    _compute_curves = njit(
+        'float64[:, :](float64[:, :], int64[:], int64[:])',
+        parallel=True, cache=True, fastmath=_FASTMATH,
+    )(_compute_curves)
 
 
 class TreasuryXMLParser:
     """Parses Treasury XML data."""
 
     def __init__(self):
-        self.maturity_mapper = MaturityMapper()
+        # lxml accepts parser options and only reports events for entry
+        # elements; the stdlib falls back to its defaults and a tag check
+        self._iterparse_options = (
+            {'tag': _ENTRY_TAG, 'remove_blank_text': True, 'huge_tree': True} if HAS_LXML else {}
+        )
 
-    def parse(self, xml_content: str) -> Dict[str, Dict[int, float]]:
+    def parse(self, xml_content: Union[bytes, str]) -> Dict[str, Dict[int, float]]:
         """
         Parse XML content and extract yield curve data.
 
         Args:
-            xml_content: XML string from Treasury API
+            xml_content: Raw XML bytes from Treasury API (str is also accepted)
 
         Returns:
             Dictionary mapping dates to rate dictionaries
         """
-        # Remove namespaces for simpler parsing
-        xml_content = self._strip_namespaces(xml_content)
+        return dict(self.iter_entries(xml_content))
+
+    def iter_entries(self, xml_content: Union[bytes, str]) -> Iterator[Tuple[str, Dict[int, float]]]:
+        """
+        Lazily yield (date, raw rates) pairs as each entry is parsed.
+
+        Args:
+            xml_content: Raw XML bytes from Treasury API (str is also accepted)
+
+        Yields:
+            Date string and dictionary mapping days to BEY rates
+        """
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode('utf-8')
+
+        context = ET.iterparse(io.BytesIO(xml_content), events=('end',), **self._iterparse_options)
 
-        root = ET.fromstring(xml_content)
-        rates_by_date = {}
+        # Stream entries and discard each one once parsed to keep memory flat
+        for _, elem in context:
+            # lxml already filters on the tag; the stdlib reports every element
+            if elem.tag != _ENTRY_TAG:
+                continue
 
-        for entry in root.findall('.//entry'):
-            date, raw_rates = self._parse_entry(entry)
+            date, raw_rates = self._parse_entry(elem)
             if date and raw_rates:
-                rates_by_date[date] = raw_rates
+                yield date, raw_rates
 
-        return rates_by_date
+            if HAS_LXML:
+                elem.clear(keep_tail=True)
+                # Also drop the emptied siblings already attached to the root
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            else:
+                elem.clear()
 
     def _parse_entry(self, entry: ET.Element) -> Tuple[Optional[str], Dict[int, float]]:
         """Parse a single entry element."""
-        properties = entry.find('content/properties')
+        properties = entry.find('a:content/m:properties', _NS)
         if properties is None:
             return None, {}
 
         date = None
         raw_rates = {}
+        tag_to_days = _BC_TAG_TO_DAYS.get
+        date_tag = _DATE_TAG
 
         for prop in properties:
-            if prop.tag == 'NEW_DATE' and prop.text:
-                date = prop.text.strip()
-            elif prop.tag.startswith('BC_') and prop.text:
-                days = self.maturity_mapper.get_days(prop.tag)
-                if days:
-                    try:
-                        rate = float(prop.text.strip())
-                        raw_rates[days] = rate
-                    except ValueError:
-                        logger.warning(f"Invalid rate value for {prop.tag}: {prop.text}")
+            tag = prop.tag
+            days = tag_to_days(tag)
+            if days is not None:
+                # float() tolerates surrounding whitespace, so no strip() copy
+                try:
+                    raw_rates[days] = float(prop.text)
+                except TypeError:
+                    # Empty element, e.g. m:null="true"
+                    continue
+                except ValueError:
+                    logger.warning(f"Invalid rate value for {tag}: {prop.text}")
+            elif tag == date_tag and prop.text:
+                date = prop.text
 
         return date, raw_rates
 
-    @staticmethod
-    def _strip_namespaces(xml_content: str) -> str:
-        """Remove namespace declarations from XML."""
-        replacements = [
-            ('xmlns="http://www.w3.org/2005/Atom"', ''),
-            ('xmlns:m="http://schemas.microsoft.com/ado/2007/08/dataservices/metadata"', ''),
-            ('xmlns:d="http://schemas.microsoft.com/ado/2007/08/dataservices"', ''),
-            ('m:', ''),
-            ('d:', ''),
-        ]
-
-        for old, new in replacements:
-            xml_content = xml_content.replace(old, new)
 
-        return xml_content
+class HTTPClient:
+    """HTTP client using aiohttp when available, urllib otherwise."""
 
+    HEADERS: Dict[str, str] = {
+        'User-Agent': 'Python Treasury Yield Processor/1.0',
+        'Accept-Encoding': 'gzip',
+    }
 
-class HTTPClient:
-    """Simple HTTP client using urllib."""
+    def __init__(self):
+        # Shared aiohttp session so connections are reused across fetches
+        self._session = None
 
-    @staticmethod
-    async def fetch(url: str, timeout: int = 30) -> str:
+    async def fetch(self, url: str, timeout: int = 30) -> bytes:
         """
-        Fetch content from URL using urllib.
+        Fetch content from URL, requesting a gzip-compressed response.
 
         Args:
             url: URL to fetch
             timeout: Request timeout in seconds
 
         Returns:
-            Response text content
+            Raw (decompressed) response body; encoding is left to the XML parser
 
         Raises:
+            aiohttp.ClientError: On network or HTTP errors when using aiohttp
             urllib.error.URLError: On network errors
             urllib.error.HTTPError: On HTTP errors
         """
-        loop = asyncio.get_event_loop()
+        if HAS_AIOHTTP:
+            return await self._fetch_aiohttp(url, timeout)
 
         def _fetch_sync():
-            req = urllib.request.Request(
-                url,
-                headers={
-                    'User-Agent': 'Python Treasury Yield Processor/1.0'
-                }
-            )
+            req = urllib.request.Request(url, headers=self.HEADERS)
             with urllib.request.urlopen(req, timeout=timeout) as response:
-                return response.read().decode('utf-8')
+                body = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                return body
+
+        # Run synchronous urllib in a worker thread to avoid blocking
+        if hasattr(asyncio, 'to_thread'):
+            return await asyncio.to_thread(_fetch_sync)
+        # Python 3.8 has no asyncio.to_thread
+        return await asyncio.get_running_loop().run_in_executor(None, _fetch_sync)
+
+    async def _fetch_aiohttp(self, url: str, timeout: int) -> bytes:
+        """Fetch content with the shared aiohttp session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self.HEADERS)
+
+        async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            # aiohttp transparently decompresses gzip bodies
+            return await response.read()
+
+    async def close(self):
+        """Close the underlying aiohttp session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+@dataclass(frozen=True)
+class _CurveLookup:
+    """Sorted (days, rates) view of a curve for repeated tenor queries."""
+    xp: Sequence[int]
+    fp: Sequence[float]
+
+    @classmethod
+    def from_rates(cls, rates: Dict[int, float]) -> "_CurveLookup":
+        """Sort a rate dictionary once so each query is a binary search."""
+        if HAS_NUMPY:
+            return cls(*_curve_arrays(rates))
+        xp = sorted(rates)
+        return cls(xp, [rates[days] for days in xp])
+
+    def rate_for_days(self, target_days: int) -> float:
+        """Interpolate linearly, extrapolating flat beyond the known range."""
+        xp, fp = self.xp, self.fp
+        if HAS_NUMPY:
+            i = int(np.searchsorted(xp, target_days))
+        else:
+            i = bisect.bisect_left(xp, target_days)
+
+        if i < len(xp) and xp[i] == target_days:
+            return float(fp[i])
+
+        # Extrapolate if needed (using nearest point)
+        if i == 0:
+            return float(fp[0])
+        if i == len(xp):
+            return float(fp[-1])
+
+        lower_days, upper_days = xp[i - 1], xp[i]
+        lower_rate, upper_rate = fp[i - 1], fp[i]
+        weight = (target_days - lower_days) / (upper_days - lower_days)
+        return float(lower_rate + weight * (upper_rate - lower_rate))
+
+    def rates_for_days(self, tenors: Sequence[int]) -> List[float]:
+        """Look up several tenors at once."""
+        if HAS_NUMPY:
+            # np.interp clamps to the end points, matching rate_for_days
+            return np.interp(tenors, self.xp, self.fp).tolist()
+        return [self.rate_for_days(days) for days in tenors]
+
+
+@dataclass
+class CurveSet:
+    """
+    Continuous rate curves for many dates in struct-of-arrays layout.
+
+    rates[i][j] is the rate for dates[i] at days[j], NaN where it could not
+    be interpolated. days and rates are NumPy arrays when NumPy is
+    installed and plain lists otherwise.
+    """
+    dates: List[str]
+    days: Sequence[int]
+    rates: Sequence[Sequence[float]]
+
+    @classmethod
+    def from_rows(cls, dates: List[str], days: Sequence[int], rows: List[List[float]]) -> "CurveSet":
+        """Build a CurveSet from one list of rates per date."""
+        if HAS_NUMPY:
+            rates = np.array(rows, dtype=np.float64).reshape(len(rows), len(days))
+            return cls(dates, np.asarray(days, dtype=np.int64), rates)
+        return cls(dates, list(days), rows)
 
-        # Run synchronous urllib in executor to avoid blocking
-        return await loop.run_in_executor(None, _fetch_sync)
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def as_dict(self, i: int) -> Dict[int, float]:
+        """Return the curve of the i-th date as a days -> rate dictionary."""
+        days = self.days.tolist() if HAS_NUMPY else self.days
+        rates = self.rates[i].tolist() if HAS_NUMPY else self.rates[i]
+        return {d: rate for d, rate in zip(days, rates) if not math.isnan(rate)}
+
+    def to_dict(self) -> Dict[str, Dict[int, float]]:
+        """Return all curves as a date -> (days -> rate) dictionary."""
+        return {date: self.as_dict(i) for i, date in enumerate(self.dates)}
 
 
 class YieldCurveProcessor:
@@ -272,8 +570,12 @@ class YieldCurveProcessor:
         self.interpolator = RateInterpolator(self.config.maturities)
         self.converter = RateConverter()
         self.http_client = HTTPClient()
+        if HAS_NUMBA:
+            self._raw_days = np.array(sorted(set(MaturityMapper.FIELD_TO_DAYS.values())), dtype=np.int64)
+            self._raw_columns = {days: j for j, days in enumerate(self._raw_days.tolist())}
+            self._targets = np.asarray(self.config.maturities, dtype=np.int64)
 
-    async def fetch_data(self) -> str:
+    async def fetch_data(self) -> bytes:
         """Fetch XML data from Treasury API."""
         try:
             return await self.http_client.fetch(self.config.url, self.config.timeout)
@@ -287,38 +589,71 @@ class YieldCurveProcessor:
             logger.error(f"Failed to fetch data: {e}")
             raise
 
-    def process(self, xml_content: str) -> Dict[str, Dict[int, float]]:
+    async def close(self):
+        """Release network resources held by the HTTP client."""
+        await self.http_client.close()
+
+    def process(self, xml_content: Union[bytes, str]) -> "CurveSet":
         """
         Process XML content to extract and convert yield curve data.
 
         Args:
-            xml_content: Raw XML string
+            xml_content: Raw XML bytes (or string)
 
         Returns:
-            Dictionary mapping dates to continuous rate curves
+            CurveSet holding the continuous rate curve of every date
         """
-        # Parse XML
-        rates_by_date = self.parser.parse(xml_content)
+        # Parse, interpolate and convert one entry at a time
+        entries = self.parser.iter_entries(xml_content)
 
-        # Process each date
-        processed_data = {}
-        for date, raw_rates in rates_by_date.items():
-            # Interpolate missing maturities
+        if HAS_NUMBA:
+            return self._process_batch(entries)
+
+        dates = []
+        rows = []
+        for date, raw_rates in entries:
             interpolated = self.interpolator.interpolate(raw_rates)
             if interpolated:
-                # Convert to continuous rates
                 continuous = self.converter.to_continuous(interpolated)
-                processed_data[date] = continuous
-
-        return processed_data
-
-    def get_latest_rates(self, processed_data: Dict[str, Dict[int, float]]) -> Optional[Tuple[str, Dict[int, float]]]:
+                dates.append(date)
+                rows.append([continuous.get(days, math.nan) for days in self.config.maturities])
+
+        return CurveSet.from_rows(dates, self.config.maturities, rows)
+
+    def _process_batch(self, entries: Iterable[Tuple[str, Dict[int, float]]]) -> "CurveSet":
+        """Interpolate and convert all dates at once with the parallel kernel."""
+        # Only a compact row of floats is kept per date until the kernel runs
+        dates = []
+        rows = []
+        for date, raw_rates in entries:
+            row = np.full(len(self._raw_columns), np.nan)
+            for days, bey in raw_rates.items():
+                row[self._raw_columns[days]] = bey
+            dates.append(date)
+            rows.append(row)
+
+        if not rows:
+            return CurveSet.from_rows([], self.config.maturities, [])
+
+        curves = _compute_curves(np.vstack(rows), self._raw_days, self._targets)
+
+        missing = np.isnan(curves)
+        for column in np.nonzero(missing)[1].tolist():
+            logger.warning(f"Cannot interpolate for {self.config.maturities[column]} days")
+
+        # Drop dates for which no target maturity could be computed
+        keep = ~missing.all(axis=1)
+        dates = [date for date, kept in zip(dates, keep.tolist()) if kept]
+        return CurveSet(dates, self._targets, curves[keep])
+
+    def get_latest_rates(self, processed_data: "CurveSet") -> Optional[Tuple[str, Dict[int, float]]]:
         """Get the latest date's rates."""
         if not processed_data:
             return None
 
-        latest_date = max(processed_data.keys())
-        return latest_date, processed_data[latest_date]
+        dates = processed_data.dates
+        latest = max(range(len(dates)), key=dates.__getitem__)
+        return dates[latest], processed_data.as_dict(latest)
 
     def get_rate_for_days(self, rates: Dict[int, float], target_days: int) -> float:
         """
@@ -335,31 +670,7 @@ class YieldCurveProcessor:
         if target_days in rates:
             return rates[target_days]
 
-        # Find surrounding points for interpolation
-        sorted_days = sorted(rates.keys())
-        lower_days = None
-        upper_days = None
-
-        for days in sorted_days:
-            if days < target_days:
-                lower_days = days
-            elif days > target_days and upper_days is None:
-                upper_days = days
-                break
-
-        # Interpolate if we have both bounds
-        if lower_days is not None and upper_days is not None:
-            lower_rate = rates[lower_days]
-            upper_rate = rates[upper_days]
-            # Linear interpolation
-            weight = (target_days - lower_days) / (upper_days - lower_days)
-            return lower_rate + weight * (upper_rate - lower_rate)
-
-        # Extrapolate if needed (using nearest point)
-        if lower_days is None:
-            return rates[sorted_days[0]]
-        if upper_days is None:
-            return rates[sorted_days[-1]]
+        return _CurveLookup.from_rates(rates).rate_for_days(target_days)
 
     def get_vix_term_rates(self, rates: Dict[int, float], near_term_days: int = 23, next_term_days: int = 30) -> Dict[str, float]:
         """
@@ -373,8 +684,8 @@ class YieldCurveProcessor:
         Returns:
             Dictionary with near_term_rate and next_term_rate
         """
-        near_term_rate = self.get_rate_for_days(rates, near_term_days)
-        next_term_rate = self.get_rate_for_days(rates, next_term_days)
+        lookup = _CurveLookup.from_rates(rates)
+        near_term_rate, next_term_rate = lookup.rates_for_days([near_term_days, next_term_days])
 
         return {
             'near_term_rate': near_term_rate,
@@ -397,6 +708,14 @@ class YieldCurveProcessor:
         return "\n".join(lines)
 
 
+def to_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when available."""
+    if HAS_ORJSON:
+        # orjson stringifies the integer maturity keys itself
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -477,7 +796,14 @@ async def main():
         # Fetch data
         if not args.json_only:
             logger.info(f"Fetching Treasury yield curve data for year {args.year}...")
-        xml_content = await processor.fetch_data()
+        # Hard deadline on top of the per-request timeout
+        deadline = config.timeout + 5
+        try:
+            xml_content = await asyncio.wait_for(processor.fetch_data(), timeout=deadline)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Fetching data took longer than {deadline} seconds")
+        finally:
+            await processor.close()
 
         # Process data
         if not args.json_only:
@@ -492,15 +818,18 @@ async def main():
             # Calculate VIX-style near-term and next-term rates
             vix_rates = processor.get_vix_term_rates(latest_rates, args.near, args.next)
 
+            # Build and serialize the output once for both stdout and the file
+            output_data = {
+                "date": latest_date,
+                "year": args.year,
+                "vix_term_rates": vix_rates,
+                "full_rates": latest_rates
+            }
+            output_json = to_json(output_data)
+
             if args.json_only:
                 # JSON output only
-                output_data = {
-                    "date": latest_date,
-                    "year": args.year,
-                    "vix_term_rates": vix_rates,
-                    "full_rates": {str(k): v for k, v in latest_rates.items()}
-                }
-                print(json.dumps(output_data, indent=2))
+                print(output_json)
             else:
                 # Display full yield curve
                 output = processor.format_output(latest_date, latest_rates)
@@ -514,26 +843,20 @@ async def main():
                 print(f"Next-term rate ({vix_rates['next_term_days']} days): {vix_rates['next_term_rate']:.6f} ({vix_rates['next_term_rate']*100:.2f}%)")
 
             # Save to JSON file
-            output_data = {
-                "date": latest_date,
-                "year": args.year,
-                "full_rates": {str(k): v for k, v in latest_rates.items()},
-                "vix_term_rates": vix_rates
-            }
             with open(args.output_file, "w") as f:
-                json.dump(output_data, f, indent=2)
+                f.write(output_json)
                 if not args.json_only:
                     logger.info(f"Saved latest rates to {args.output_file}")
         else:
             if args.json_only:
-                print(json.dumps({"error": "No data found"}, indent=2))
+                print(to_json({"error": "No data found"}))
             else:
                 logger.error("No data found")
             sys.exit(1)
 
     except Exception as e:
         if args.json_only:
-            print(json.dumps({"error": str(e)}, indent=2))
+            print(to_json({"error": str(e)}))
         else:
             logger.error(f"Error processing yield curve data: {e}")
         sys.exit(1)
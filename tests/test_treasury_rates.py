@@ -1,4 +1,5 @@
 import asyncio
+import gzip
 import json
 import pytest
 from datetime import datetime
@@ -7,12 +8,42 @@ from unittest.mock import Mock, patch, AsyncMock
 # Import from src
 import sys
 sys.path.insert(0, 'src')
+import treasury_rates
 from treasury_rates import (
     YieldCurveConfig, MaturityMapper, RateInterpolator,
-    RateConverter, YieldCurveProcessor
+    RateConverter, TreasuryXMLParser, HTTPClient, CurveSet, YieldCurveProcessor,
+    to_json
 )
 
 
+SAMPLE_XML = b"""<?xml version="1.0" encoding="utf-8" standalone="yes"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:m="http://schemas.microsoft.com/ado/2007/08/dataservices/metadata" xmlns:d="http://schemas.microsoft.com/ado/2007/08/dataservices">
+  <title type="text">DailyTreasuryYieldCurveRateData</title>
+  <entry>
+    <content type="application/xml">
+      <m:properties>
+        <d:Id m:type="Edm.Int32">1</d:Id>
+        <d:NEW_DATE m:type="Edm.DateTime">2024-01-02T00:00:00</d:NEW_DATE>
+        <d:BC_1MONTH m:type="Edm.Double">5.55</d:BC_1MONTH>
+        <d:BC_2MONTH m:type="Edm.Double" m:null="true" />
+        <d:BC_1YEAR m:type="Edm.Double">4.80</d:BC_1YEAR>
+      </m:properties>
+    </content>
+  </entry>
+  <entry>
+    <content type="application/xml">
+      <m:properties>
+        <d:Id m:type="Edm.Int32">2</d:Id>
+        <d:NEW_DATE m:type="Edm.DateTime">2024-01-03T00:00:00</d:NEW_DATE>
+        <d:BC_1MONTH m:type="Edm.Double">5.54</d:BC_1MONTH>
+        <d:BC_1YEAR m:type="Edm.Double">4.79</d:BC_1YEAR>
+      </m:properties>
+    </content>
+  </entry>
+</feed>
+"""
+
+
 class TestMaturityMapper:
     def test_get_days_valid_field(self):
         assert MaturityMapper.get_days("BC_1MONTH") == 30
@@ -42,6 +73,12 @@ class TestRateInterpolator:
         expected_90 = 0.04 + (0.05 - 0.04) * ((90 - 30) / (365 - 30))
         assert abs(result[90] - expected_90) < 0.0001
 
+    def test_interpolate_skips_out_of_range(self):
+        rates = {60: 0.045, 180: 0.05}
+        result = self.interpolator.interpolate(rates)
+        assert list(result) == [60, 90, 180]
+        assert abs(result[90] - 0.04625) < 0.0001
+
     def test_interpolate_empty_rates(self):
         result = self.interpolator.interpolate({})
         assert result is None
@@ -61,12 +98,81 @@ class TestRateConverter:
         # r_t = ln(1.050625) ≈ 0.04939
         assert abs(result[365] - 0.04939) < 0.0001
 
+    def test_to_continuous_small_rate(self):
+        # Matches ln(1 + APY) without losing precision near zero
+        result = RateConverter.to_continuous({30: 1e-10})
+        assert abs(result[30] - 1e-12) < 1e-24
+
+    def test_to_continuous_batch(self):
+        curves = {
+            "2024-01-02": {30: 4.0, 365: 5.0},
+            "2024-01-03": {30: 5.0},
+        }
+        result = RateConverter.to_continuous_batch(curves)
+
+        assert list(result) == ["2024-01-02", "2024-01-03"]
+        assert abs(result["2024-01-02"][30] - 0.03961) < 0.0001
+        assert abs(result["2024-01-02"][365] - 0.04939) < 0.0001
+        assert abs(result["2024-01-03"][30] - 0.04939) < 0.0001
+
+    def test_to_continuous_batch_empty(self):
+        assert RateConverter.to_continuous_batch({}) == {}
+
+
+class TestTreasuryXMLParser:
+    def test_parse_bytes(self):
+        result = TreasuryXMLParser().parse(SAMPLE_XML)
+        assert result == {
+            "2024-01-02T00:00:00": {30: 5.55, 365: 4.80},
+            "2024-01-03T00:00:00": {30: 5.54, 365: 4.79},
+        }
+
+    def test_parse_str(self):
+        result = TreasuryXMLParser().parse(SAMPLE_XML.decode("utf-8"))
+        assert result["2024-01-02T00:00:00"] == {30: 5.55, 365: 4.80}
+
+    def test_iter_entries_is_lazy(self):
+        entries = TreasuryXMLParser().iter_entries(SAMPLE_XML)
+        assert next(entries) == ("2024-01-02T00:00:00", {30: 5.55, 365: 4.80})
+        assert next(entries) == ("2024-01-03T00:00:00", {30: 5.54, 365: 4.79})
+        with pytest.raises(StopIteration):
+            next(entries)
+
+    def test_parse_invalid_rate(self):
+        xml = SAMPLE_XML.replace(b">5.54<", b">n/a<")
+        result = TreasuryXMLParser().parse(xml)
+        assert result["2024-01-03T00:00:00"] == {365: 4.79}
+
 
 class TestYieldCurveProcessor:
     @pytest.fixture
     def processor(self):
         return YieldCurveProcessor()
 
+    def test_process(self):
+        config = YieldCurveConfig(maturities=(30, 91, 365, 730))
+        result = YieldCurveProcessor(config).process(SAMPLE_XML)
+
+        assert isinstance(result, CurveSet)
+        assert result.dates == ["2024-01-02T00:00:00", "2024-01-03T00:00:00"]
+        assert list(result.days) == [30, 91, 365, 730]
+        curve = result.as_dict(0)
+        # 730 days lies beyond the last observed maturity and is skipped
+        assert list(curve) == [30, 91, 365]
+        assert abs(curve[30] - 0.05474) < 0.0001
+        bey_91 = 5.55 + (4.80 - 5.55) * ((91 - 30) / (365 - 30))
+        assert abs(curve[91] - RateConverter.to_continuous({91: bey_91})[91]) < 1e-12
+
+    def test_get_latest_rates(self, processor):
+        curves = CurveSet.from_rows(
+            ["2024-01-03", "2024-01-02"], (30, 60), [[0.04, float("nan")], [0.03, 0.035]]
+        )
+        assert processor.get_latest_rates(curves) == ("2024-01-03", {30: 0.04})
+        assert curves.to_dict()["2024-01-02"] == {30: 0.03, 60: 0.035}
+
+    def test_get_latest_rates_empty(self, processor):
+        assert processor.get_latest_rates(CurveSet.from_rows([], (30, 60), [])) is None
+
     def test_get_rate_for_days_exact(self, processor):
         rates = {30: 0.04, 60: 0.045, 365: 0.05}
         assert processor.get_rate_for_days(rates, 30) == 0.04
@@ -79,6 +185,11 @@ class TestYieldCurveProcessor:
         expected = 0.04 + (0.045 - 0.04) * ((45 - 30) / (60 - 30))
         assert abs(result - expected) < 0.0001
 
+    def test_get_rate_for_days_extrapolate(self, processor):
+        rates = {30: 0.04, 60: 0.045}
+        assert processor.get_rate_for_days(rates, 10) == 0.04
+        assert processor.get_rate_for_days(rates, 90) == 0.045
+
     def test_get_vix_term_rates(self, processor):
         rates = {i: 0.04 + i * 0.00001 for i in range(1, 366)}
         result = processor.get_vix_term_rates(rates, 23, 30)
@@ -90,6 +201,15 @@ class TestYieldCurveProcessor:
         assert result['near_term_rate'] < result['next_term_rate']
 
 
+class TestToJson:
+    def test_int_keys_stringified(self):
+        data = {"date": "2024-01-02", "full_rates": {30: 0.04, 365: 0.05}}
+        assert json.loads(to_json(data)) == {"date": "2024-01-02", "full_rates": {"30": 0.04, "365": 0.05}}
+
+    def test_indented(self):
+        assert to_json({"a": 1}) == '{\n  "a": 1\n}'
+
+
 @pytest.mark.asyncio
 class TestIntegration:
     async def test_config_default_year(self):
@@ -101,6 +221,21 @@ class TestIntegration:
         assert config.year == 2023
         assert "2023" in config.url
 
+    async def test_fetch_urllib_gzip(self):
+        response = Mock()
+        response.read.return_value = gzip.compress(SAMPLE_XML)
+        response.headers = {'Content-Encoding': 'gzip'}
+        response.__enter__ = Mock(return_value=response)
+        response.__exit__ = Mock(return_value=False)
+
+        with patch.object(treasury_rates, 'HAS_AIOHTTP', False), \
+                patch('urllib.request.urlopen', return_value=response) as urlopen:
+            body = await HTTPClient().fetch("https://example.com/feed.xml")
+
+        assert body == SAMPLE_XML
+        request = urlopen.call_args[0][0]
+        assert request.get_header('Accept-encoding') == 'gzip'
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])